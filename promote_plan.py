@@ -15,11 +15,12 @@ import argparse
 import json
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 
-def promote(name: str, plan_path: Path, cache_dir: Path, output_root: Path) -> Path:
+def promote(name: str, plan_path: Path, cache_dir: Path, output_root: Path, preserve_mtime: bool = False) -> Path:
     dest = output_root / name
     if dest.exists():
         print(f"Error: directory already exists: {dest}", file=sys.stderr)
@@ -30,49 +31,69 @@ def promote(name: str, plan_path: Path, cache_dir: Path, output_root: Path) -> P
     dest.mkdir(parents=True)
     (dest / "artifacts").mkdir()
 
+    # Plain content copies unless timestamps were asked for; copy2 adds
+    # stat/utime calls per file to carry metadata over
+    copy = shutil.copy2 if preserve_mtime else shutil.copyfile
+
     # Copy the plan
-    shutil.copy2(plan_path, dest / "PRD.md")
+    copy(plan_path, dest / "PRD.md")
     print(f"  Copied plan → {dest / 'PRD.md'}")
 
-    # Copy cached artifacts if available
+    # Copy cached artifacts if available. Both copy functions copy file data
+    # in the kernel on Linux (os.sendfile, Python 3.8+), even across
+    # filesystems.
     copied_artifacts = []
     for filename in ["visual_analysis.json", "synthesis.json"]:
         src = cache_dir / filename
         if src.exists():
-            shutil.copy2(src, dest / "artifacts" / filename)
+            if not copied_artifacts and src.stat().st_dev != dest.stat().st_dev:
+                print("  Note: cache and destination are on different filesystems")
+            copy(src, dest / "artifacts" / filename)
             copied_artifacts.append(filename)
             print(f"  Copied artifact → artifacts/{filename}")
 
-    # Write metadata
+    # Build metadata
+    now = datetime.now()
     metadata = {
         "name": name,
-        "promoted_at": datetime.now().isoformat(),
+        "promoted_at": now.isoformat(),
         "source_plan": str(plan_path),
         "source_cache": str(cache_dir),
         "artifacts": copied_artifacts,
     }
-    (dest / "artifacts" / "metadata.json").write_text(
-        json.dumps(metadata, indent=2) + "\n"
-    )
 
     # Generate README
-    readme_lines = [
-        f"# {name}",
-        "",
-        f"Engineering plan promoted on {datetime.now().strftime('%Y-%m-%d')}.",
-        "",
-        "## Contents",
-        "",
-        "- **PRD.md** — Product Requirements Document",
-    ]
-    if "visual_analysis.json" in copied_artifacts:
-        readme_lines.append("- **artifacts/visual_analysis.json** — Timestamped visual observations from source video")
-    if "synthesis.json" in copied_artifacts:
-        readme_lines.append("- **artifacts/synthesis.json** — Synthesized pain points, workflows, and requirements")
-    readme_lines.append("- **artifacts/metadata.json** — Promotion metadata")
-    readme_lines.append("")
-
-    (dest / "README.md").write_text("\n".join(readme_lines))
+    readme = (
+        f"# {name}\n"
+        "\n"
+        f"Engineering plan promoted on {now.strftime('%Y-%m-%d')}.\n"
+        "\n"
+        "## Contents\n"
+        "\n"
+        "- **PRD.md** — Product Requirements Document\n"
+        + ("- **artifacts/visual_analysis.json** — Timestamped visual observations from source video\n"
+           if "visual_analysis.json" in copied_artifacts else "")
+        + ("- **artifacts/synthesis.json** — Synthesized pain points, workflows, and requirements\n"
+           if "synthesis.json" in copied_artifacts else "")
+        + "- **artifacts/metadata.json** — Promotion metadata\n"
+    )
+
+    # Write both files concurrently
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        writes = [
+            pool.submit(
+                (dest / "artifacts" / "metadata.json").write_text,
+                json.dumps(metadata, indent=2) + "\n",
+                encoding="utf-8",
+            ),
+            pool.submit(
+                (dest / "README.md").write_text,
+                readme,
+                encoding="utf-8",
+            ),
+        ]
+        for write in writes:
+            write.result()
     print(f"  Generated → README.md")
 
     return dest
@@ -93,24 +114,28 @@ Examples:
     parser.add_argument("--plan", default="engineering_plan.md", help="Path to engineering plan (default: engineering_plan.md)")
     parser.add_argument("--cache", default=".cache", help="Path to .cache directory with artifacts (default: .cache)")
     parser.add_argument("--output-root", default=".", help="Parent directory for the promoted plan (default: current dir)")
+    parser.add_argument("--preserve-mtime", action="store_true", help="Keep source modification times on copied files")
 
     args = parser.parse_args()
 
-    plan_path = Path(args.plan).resolve()
-    cache_dir = Path(args.cache).resolve()
     output_root = Path(args.output_root).resolve()
 
-    if not plan_path.exists():
-        print(f"Error: plan not found: {plan_path}", file=sys.stderr)
+    # Strict resolution checks existence in the same pass
+    try:
+        plan_path = Path(args.plan).resolve(strict=True)
+    except FileNotFoundError:
+        print(f"Error: plan not found: {Path(args.plan).resolve()}", file=sys.stderr)
         sys.exit(1)
 
-    if not cache_dir.exists():
-        print(f"Warning: cache directory not found: {cache_dir}", file=sys.stderr)
+    try:
+        cache_dir = Path(args.cache).resolve(strict=True)
+    except FileNotFoundError:
+        print(f"Warning: cache directory not found: {Path(args.cache).resolve()}", file=sys.stderr)
         print("  Promoting plan without artifacts.", file=sys.stderr)
         cache_dir = Path("/nonexistent")  # will just skip artifact copies
 
     print(f"Promoting: {args.name}")
-    dest = promote(args.name, plan_path, cache_dir, output_root)
+    dest = promote(args.name, plan_path, cache_dir, output_root, preserve_mtime=args.preserve_mtime)
 
     print(f"\nDone. Directory ready at: {dest}")
     print(f"\n  cd {dest} && git init && git add -A && git commit -m 'Initial PRD'")
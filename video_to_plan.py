@@ -12,16 +12,24 @@ Pipeline:
               → engineering_plan.md
 """
 
+from __future__ import annotations
+
 import argparse
 import json
 import os
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import ijson
+import orjson
 
-from google import genai
-from google.genai import types as genai_types
-import openai
+# The SDKs are imported where they are used so that --help and runs that
+# skip their phases don't pay for loading them
+if TYPE_CHECKING:
+    from google import genai
 
 
 # ---------------------------------------------------------------------------
@@ -84,6 +92,54 @@ Return ONLY valid JSON, no markdown fences.
 """
 
 
+# Minimum seconds between streaming progress lines
+_PROGRESS_INTERVAL = 1.0
+
+# Background pool for input reads, and for cache writes and cleanup that
+# later phases don't need to wait on; drained at the end of main()
+_io_executor = ThreadPoolExecutor(max_workers=2)
+
+
+# Cache writes submitted to _io_executor; main() checks them before exiting
+_cache_writes: list[tuple[Path, Future]] = []
+
+
+def _save_in_background(path: Path, obj) -> None:
+    """Write obj to path as JSON on the background I/O pool.
+
+    Unlike _in_background, failures are not best-effort: main() checks every
+    cache write and exits non-zero if one failed.
+    """
+    _cache_writes.append((path, _io_executor.submit(_write_json, path, obj)))
+
+
+def _cache_write_failures() -> int:
+    """Report failed background cache writes to stderr; returns how many failed."""
+    failures = 0
+    for path, future in _cache_writes:
+        if future.exception() is not None:
+            print(f"Error: failed to write {path}: {future.exception()}", file=sys.stderr)
+            failures += 1
+    return failures
+
+
+def _in_background(fn, *args, **kwargs) -> None:
+    """Run best-effort work on the background I/O pool, reporting any failure to stderr."""
+    def _report(future):
+        if future.exception() is not None:
+            print(f"Warning: background task failed: {future.exception()}", file=sys.stderr)
+
+    _io_executor.submit(fn, *args, **kwargs).add_done_callback(_report)
+
+
+def _delete_uploaded_file(client, name: str) -> None:
+    """Delete an uploaded file from the Gemini Files API, ignoring errors."""
+    try:
+        client.files.delete(name=name)
+    except Exception:
+        pass
+
+
 def _elapsed(start: float) -> str:
     """Format elapsed time since start."""
     secs = int(time.time() - start)
@@ -92,15 +148,64 @@ def _elapsed(start: float) -> str:
     return f"{secs // 60}m {secs % 60}s"
 
 
-def _strip_fences(text: str) -> str:
-    """Strip markdown code fences from text."""
-    text = text.strip()
-    if text.startswith("```"):
-        text = text.split("\n", 1)[1]
-        if text.endswith("```"):
-            text = text.rsplit("```", 1)[0]
-        text = text.strip()
-    return text
+def _strip_fences(texts):
+    """Yield streamed text with any surrounding markdown code fence removed.
+
+    Gemini is asked for JSON output, so fences should not appear; this guards
+    against models that add them anyway. Only the first non-whitespace
+    character is inspected for the common unfenced case.
+    """
+    texts = iter(texts)
+    head = ""
+    for chunk in texts:
+        head += chunk
+        text = head.lstrip()
+        if not text or "```".startswith(text):
+            continue
+        if not text.startswith("```"):
+            # No fence: pass the rest of the stream through untouched
+            yield text
+            yield from texts
+            return
+        if "\n" in text:
+            break
+    else:
+        return
+
+    # Drop the opening fence line and hold back any trailing whitespace plus
+    # the three characters before it, so the closing fence can be trimmed
+    # once the stream ends
+    tail = text.split("\n", 1)[1]
+    for chunk in texts:
+        text = tail + chunk
+        cut = max(len(text.rstrip()) - 3, 0)
+        tail = text[cut:]
+        if cut:
+            yield text[:cut]
+    tail = tail.rstrip()
+    if tail.endswith("```"):
+        tail = tail[:-3]
+    if tail:
+        yield tail
+
+
+def _dumps(obj) -> str:
+    """Serialize obj as indented JSON, keeping non-ASCII characters as-is."""
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    except TypeError:
+        # orjson rejects integers wider than 64 bits; the stdlib doesn't
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _write_json(path: Path, obj) -> None:
+    """Write obj to path as indented UTF-8 JSON without an intermediate str."""
+    try:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    except TypeError:
+        # orjson rejects integers wider than 64 bits; the stdlib doesn't
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    path.write_bytes(data)
 
 
 def _progress(msg: str) -> None:
@@ -108,57 +213,143 @@ def _progress(msg: str) -> None:
     print(msg, flush=True)
 
 
-def _stream_gemini(client, model: str, contents, label: str) -> str:
-    """Stream a Gemini response, printing periodic progress. Returns full text."""
+def _check_overflow(error: Exception, label: str, can_reparse: bool) -> None:
+    """Re-raise an ijson error unless it is a recoverable integer overflow.
+
+    yajl rejects integers wider than 64 bits. That is recoverable only when
+    the response text was kept and can be re-parsed with the stdlib.
+    """
+    if "integer overflow" not in str(error):
+        raise error
+    if not can_reparse:
+        raise ValueError(f"{label}: response contains an integer wider than 64 bits") from error
+
+
+def _stream_gemini(client, model: str, contents, label: str, keep_text: bool = False) -> tuple[dict, str | None]:
+    """Stream a Gemini JSON response, printing periodic progress.
+
+    The response is parsed incrementally as chunks arrive. Returns the parsed
+    top-level object, plus the raw JSON text if keep_text is set (otherwise
+    None, and the full text is never buffered). Raises ValueError if the
+    response is not a JSON object.
+    """
+    from google.genai import types as genai_types
+
     _progress(f"  Streaming from {model}...")
     start = time.time()
-    chunks = []
     char_count = 0
-    last_report = 0
-
+    result = {}
+    pieces = [] if keep_text else None
+    first_char = None
+    parsing = True
+    items = ijson.sendable_list()
+    parser = ijson.kvitems_coro(items, "", use_float=True)
+
+    next_report = time.monotonic() + _PROGRESS_INTERVAL
     response = client.models.generate_content_stream(
         model=model,
         contents=contents,
         config=genai_types.GenerateContentConfig(
             temperature=0.2,
             max_output_tokens=65536,
+            response_mime_type="application/json",
         ),
     )
 
-    for chunk in response:
-        if chunk.text:
-            chunks.append(chunk.text)
-            char_count += len(chunk.text)
-            # Print progress every 2000 chars to avoid spam
-            if char_count - last_report >= 2000:
-                _progress(f"  ... {label}: {char_count:,} chars ({_elapsed(start)})")
-                last_report = char_count
+    # Bind hot-loop lookups to locals; chunk.text goes through an SDK
+    # property, so read it only once per chunk
+    send = parser.send
+    keep = pieces.append if keep_text else None
+    update = result.update
+    monotonic = time.monotonic
+    for text in _strip_fences(filter(None, (chunk.text for chunk in response))):
+        if first_char is None:
+            stripped = text.lstrip()
+            if stripped:
+                first_char = stripped[0]
+                if first_char != "{":
+                    raise ValueError(f"{label}: expected a JSON object from {model}, got {stripped[:40]!r}")
+        if keep is not None:
+            keep(text)
+        if parsing:
+            try:
+                send(text.encode("utf-8"))
+            except ijson.JSONError as e:
+                _check_overflow(e, label, keep_text)
+                parsing = False
+            update(items)
+            del items[:]
+        char_count += len(text)
+        # Print progress at most once per interval to avoid spam
+        now = monotonic()
+        if now >= next_report:
+            _progress(f"  ... {label}: {char_count:,} chars ({_elapsed(start)})")
+            next_report = now + _PROGRESS_INTERVAL
+
+    if first_char is None:
+        raise ValueError(f"{label}: empty response from {model}")
+
+    if parsing:
+        try:
+            parser.close()
+        except ijson.JSONError as e:
+            _check_overflow(e, label, keep_text)
+            parsing = False
+        result.update(items)
+    raw_text = "".join(pieces) if keep_text else None
+    if not parsing:
+        # ijson's C backend rejects integers beyond 64 bits; the stdlib
+        # parser has arbitrary precision
+        result = json.loads(raw_text)
 
     _progress(f"  ✓ {label}: {char_count:,} chars total ({_elapsed(start)})")
-    return "".join(chunks)
+    return result, raw_text
+
+
+def run_phase1(video_path: str, video_size: int, srt_future: Future, client: genai.Client, cache_dir: Path) -> tuple[dict, str]:
+    """Upload video to Gemini and extract visual observations.
 
+    srt_future resolves to the SRT content; it is only waited on once the
+    upload is under way, so the read overlaps the upload.
+    Returns the parsed observations and the raw JSON text they came from.
+    """
+    from google.genai import types as genai_types
 
-def run_phase1(video_path: str, srt_content: str, gemini_key: str, cache_dir: Path) -> dict:
-    """Upload video to Gemini and extract visual observations."""
     phase_start = time.time()
     print("=" * 60)
     print("PHASE 1: Visual Extraction (Gemini 2.5 Pro)")
     print("=" * 60)
 
-    client = genai.Client(api_key=gemini_key)
-
-    # Upload video file
-    file_size_mb = Path(video_path).stat().st_size / (1024 * 1024)
+    # Upload video file in the background; finish reading the SRT and build
+    # the prompt meanwhile
+    file_size_mb = video_size / (1024 * 1024)
     _progress(f"  Uploading video: {video_path} ({file_size_mb:.1f} MB)")
     upload_start = time.time()
-    video_file = client.files.upload(file=video_path)
+    # The SDK already sends resumable uploads in 8 MB chunks; the config just
+    # labels the file so it is identifiable in the Files API
+    upload_config = genai_types.UploadFileConfig(display_name=Path(video_path).name)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        upload_future = pool.submit(client.files.upload, file=video_path, config=upload_config)
+        try:
+            srt_content = srt_future.result()
+        except Exception:
+            # A running upload can't be cancelled; wait for it and delete the
+            # file so an unreadable SRT doesn't leave it behind
+            if upload_future.exception() is None:
+                _delete_uploaded_file(client, upload_future.result().name)
+            raise
+        prompt = PHASE1_PROMPT.format(srt_content=srt_content)
+        video_file = upload_future.result()
     _progress(f"  ✓ Upload complete in {_elapsed(upload_start)}. File: {video_file.name}")
 
-    # Poll until file is ACTIVE
+    # Poll until file is ACTIVE, backing off from 0.5s up to 5s so short
+    # videos aren't held up by a coarse polling interval
     _progress("  Waiting for file processing...")
     poll_start = time.time()
+    delay = 0.5
     while video_file.state.name == "PROCESSING":
-        time.sleep(5)
+        time.sleep(delay)
+        delay = min(delay * 1.5, 5.0)
         video_file = client.files.get(name=video_file.name)
         _progress(f"  ... still processing ({_elapsed(poll_start)})")
 
@@ -167,9 +358,6 @@ def run_phase1(video_path: str, srt_content: str, gemini_key: str, cache_dir: Pa
 
     _progress(f"  ✓ File ready ({_elapsed(poll_start)})")
 
-    # Build prompt
-    prompt = PHASE1_PROMPT.format(srt_content=srt_content)
-
     # Call Gemini with video + prompt (streaming)
     contents = [
         genai_types.Content(
@@ -183,27 +371,19 @@ def run_phase1(video_path: str, srt_content: str, gemini_key: str, cache_dir: Pa
         )
     ]
 
-    raw_text = _stream_gemini(client, "gemini-2.5-pro", contents, "Visual analysis")
-    raw_text = _strip_fences(raw_text)
+    result, raw_text = _stream_gemini(client, "gemini-2.5-pro", contents, "Visual analysis", keep_text=True)
 
-    result = json.loads(raw_text)
-
-    # Save to cache
+    # Save to cache and clean up the uploaded file in the background so
+    # Phase 2 can start right away
     out_path = cache_dir / "visual_analysis.json"
-    out_path.write_text(json.dumps(result, indent=2, ensure_ascii=False))
+    _save_in_background(out_path, result)
+    _in_background(_delete_uploaded_file, client, video_file.name)
     obs_count = len(result.get('observations', []))
-    print(f"  Saved: {out_path}")
+    print(f"  Saving: {out_path}")
     print(f"  {obs_count} visual observations extracted")
 
-    # Clean up uploaded file
-    try:
-        client.files.delete(name=video_file.name)
-        print("  Cleaned up uploaded video file.")
-    except Exception:
-        pass
-
     print(f"  Phase 1 total: {_elapsed(phase_start)}")
-    return result
+    return result, raw_text
 
 
 # ---------------------------------------------------------------------------
@@ -278,28 +458,28 @@ Return ONLY valid JSON, no markdown fences.
 """
 
 
-def run_phase2(visual_analysis: dict, srt_content: str, gemini_key: str, cache_dir: Path) -> dict:
-    """Synthesize visual analysis + transcript into structured findings."""
+def run_phase2(visual_analysis_json: str, srt_content: str, client: genai.Client, cache_dir: Path) -> dict:
+    """Synthesize visual analysis + transcript into structured findings.
+
+    visual_analysis_json is Phase 1's output as JSON text, spliced into the
+    prompt as-is rather than being parsed and re-serialized.
+    """
     phase_start = time.time()
     print("\n" + "=" * 60)
     print("PHASE 2: Synthesis (Gemini 2.5 Flash)")
     print("=" * 60)
 
-    client = genai.Client(api_key=gemini_key)
-
     prompt = PHASE2_PROMPT.format(
-        visual_analysis=json.dumps(visual_analysis, indent=2, ensure_ascii=False),
+        visual_analysis=visual_analysis_json,
         srt_content=srt_content,
     )
 
-    raw_text = _stream_gemini(client, "gemini-2.5-flash", prompt, "Synthesis")
-    raw_text = _strip_fences(raw_text)
-
-    result = json.loads(raw_text)
+    result, _ = _stream_gemini(client, "gemini-2.5-flash", prompt, "Synthesis")
 
+    # Save to cache in the background so Phase 3 can start right away
     out_path = cache_dir / "synthesis.json"
-    out_path.write_text(json.dumps(result, indent=2, ensure_ascii=False))
-    print(f"  Saved: {out_path}")
+    _save_in_background(out_path, result)
+    print(f"  Saving: {out_path}")
     print(f"  {len(result.get('pain_points', []))} pain points identified")
     print(f"  {len(result.get('current_workflows', []))} workflows documented")
     print(f"  {len(result.get('user_personas', []))} user personas identified")
@@ -391,6 +571,8 @@ Output the complete PRD in Markdown format.
 
 def run_phase3(synthesis: dict, openai_key: str, output_path: Path) -> str:
     """Generate the full PRD from synthesis using OpenAI."""
+    import openai
+
     phase_start = time.time()
     print("\n" + "=" * 60)
     print("PHASE 3: PRD Generation (OpenAI gpt-5.2)")
@@ -399,14 +581,15 @@ def run_phase3(synthesis: dict, openai_key: str, output_path: Path) -> str:
     client = openai.OpenAI(api_key=openai_key)
 
     prompt = PHASE3_PROMPT.format(
-        synthesis=json.dumps(synthesis, indent=2, ensure_ascii=False),
+        synthesis=_dumps(synthesis),
     )
 
     _progress("  Streaming from gpt-5.2...")
     start = time.time()
     chunks = []
     char_count = 0
-    last_report = 0
+    word_count = 0
+    in_word = False
 
     stream = client.chat.completions.create(
         model="gpt-5.2",
@@ -419,14 +602,25 @@ def run_phase3(synthesis: dict, openai_key: str, output_path: Path) -> str:
         stream=True,
     )
 
+    append = chunks.append
+    monotonic = time.monotonic
+    next_report = monotonic() + _PROGRESS_INTERVAL
     for event in stream:
-        delta = event.choices[0].delta.content if event.choices[0].delta else None
+        choice_delta = event.choices[0].delta
+        delta = choice_delta.content if choice_delta else None
         if delta:
-            chunks.append(delta)
+            append(delta)
             char_count += len(delta)
-            if char_count - last_report >= 2000:
+            # Count words as they stream; a word split across chunks counts once
+            words = len(delta.split())
+            if words and in_word and not delta[0].isspace():
+                words -= 1
+            word_count += words
+            in_word = not delta[-1].isspace()
+            now = monotonic()
+            if now >= next_report:
                 _progress(f"  ... PRD generation: {char_count:,} chars ({_elapsed(start)})")
-                last_report = char_count
+                next_report = now + _PROGRESS_INTERVAL
 
     _progress(f"  ✓ PRD generation: {char_count:,} chars total ({_elapsed(start)})")
 
@@ -436,8 +630,7 @@ def run_phase3(synthesis: dict, openai_key: str, output_path: Path) -> str:
     print(f"  Saved: {output_path}")
 
     # Count sections
-    section_count = sum(1 for line in prd_content.split("\n") if line.startswith("## "))
-    word_count = len(prd_content.split())
+    section_count = prd_content.count("\n## ") + prd_content.startswith("## ")
     print(f"  {section_count} top-level sections, {word_count:,} words")
     print(f"  Phase 3 total: {_elapsed(phase_start)}")
 
@@ -488,19 +681,20 @@ Examples:
     srt_path = Path(args.subtitles).resolve()
     output_path = Path(args.output).resolve()
     cache_dir = output_path.parent / ".cache"
-    cache_dir.mkdir(parents=True, exist_ok=True)
 
-    if not video_path.exists():
+    # A single stat both checks the video exists and gives Phase 1 its size
+    try:
+        video_size = video_path.stat().st_size
+    except FileNotFoundError:
         print(f"Error: Video file not found: {video_path}", file=sys.stderr)
         sys.exit(1)
     if not srt_path.exists():
         print(f"Error: Subtitle file not found: {srt_path}", file=sys.stderr)
         sys.exit(1)
 
-    # Read SRT content
-    srt_content = srt_path.read_text(encoding="utf-8")
-
     total_start = time.time()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
     print(f"Video:     {video_path}")
     print(f"Subtitles: {srt_path}")
     print(f"Output:    {output_path}")
@@ -508,35 +702,56 @@ Examples:
     print(f"Phases:    {phases_to_run}")
     print()
 
-    # --- Phase 1 ---
-    visual_analysis = None
-    if 1 in phases_to_run:
-        visual_analysis = run_phase1(str(video_path), srt_content, gemini_key, cache_dir)
-    else:
-        cached = cache_dir / "visual_analysis.json"
-        if cached.exists():
-            visual_analysis = json.loads(cached.read_text())
-            print(f"Loaded cached visual analysis: {cached}")
-        elif any(p in [2] for p in phases_to_run):
-            print(f"Error: Phase 2 requires visual_analysis.json in {cache_dir}. Run phase 1 first.", file=sys.stderr)
-            sys.exit(1)
-
-    # --- Phase 2 ---
-    synthesis = None
-    if 2 in phases_to_run:
-        synthesis = run_phase2(visual_analysis, srt_content, gemini_key, cache_dir)
-    else:
-        cached = cache_dir / "synthesis.json"
-        if cached.exists():
-            synthesis = json.loads(cached.read_text())
-            print(f"Loaded cached synthesis: {cached}")
-        elif 3 in phases_to_run:
-            print(f"Error: Phase 3 requires synthesis.json in {cache_dir}. Run phase 2 first.", file=sys.stderr)
-            sys.exit(1)
-
-    # --- Phase 3 ---
-    if 3 in phases_to_run:
-        prd = run_phase3(synthesis, openai_key, output_path)
+    # Phases 1-2 share one Gemini client so they reuse its connection pool.
+    # The SRT is read in the background meanwhile; Phase 1 waits on it only
+    # after starting the video upload.
+    srt_future = None
+    gemini_client = None
+    if any(p in [1, 2] for p in phases_to_run):
+        srt_future = _io_executor.submit(srt_path.read_text, encoding="utf-8")
+
+        from google import genai
+
+        gemini_client = genai.Client(api_key=gemini_key)
+
+    try:
+        # --- Phase 1 ---
+        visual_analysis_json = None
+        if 1 in phases_to_run:
+            _, visual_analysis_json = run_phase1(str(video_path), video_size, srt_future, gemini_client, cache_dir)
+        else:
+            cached = cache_dir / "visual_analysis.json"
+            if cached.exists():
+                visual_analysis_json = cached.read_text(encoding="utf-8")
+                print(f"Loaded cached visual analysis: {cached}")
+            elif any(p in [2] for p in phases_to_run):
+                print(f"Error: Phase 2 requires visual_analysis.json in {cache_dir}. Run phase 1 first.", file=sys.stderr)
+                sys.exit(1)
+
+        # --- Phase 2 ---
+        synthesis = None
+        if 2 in phases_to_run:
+            synthesis = run_phase2(visual_analysis_json, srt_future.result(), gemini_client, cache_dir)
+        else:
+            cached = cache_dir / "synthesis.json"
+            if cached.exists():
+                # Stdlib parser: orjson would turn integers wider than 64 bits
+                # into floats
+                synthesis = json.loads(cached.read_text(encoding="utf-8"))
+                print(f"Loaded cached synthesis: {cached}")
+            elif 3 in phases_to_run:
+                print(f"Error: Phase 3 requires synthesis.json in {cache_dir}. Run phase 2 first.", file=sys.stderr)
+                sys.exit(1)
+
+        # --- Phase 3 ---
+        if 3 in phases_to_run:
+            prd = run_phase3(synthesis, openai_key, output_path)
+    finally:
+        _io_executor.shutdown(wait=True)
+        write_failures = _cache_write_failures()
+
+    if write_failures:
+        sys.exit(1)
 
     print("\n" + "=" * 60)
     print(f"DONE — total time: {_elapsed(total_start)}")